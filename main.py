@@ -11,8 +11,6 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from src.local_sop_identifier import LocalSOPIdentifier
-
 
 def main():
     """
@@ -41,7 +39,11 @@ def main():
                         help='Path to the SOP file')
     
     args = parser.parse_args()
-    
+
+    # Import here so --help doesn't pay the torch/sentence-transformers
+    # import cost (seconds and hundreds of MB)
+    from src.local_sop_identifier import LocalSOPIdentifier
+
     print("=" * 80)
     print("Local SOP Identifier - Lightweight Offline Solution")
     print("=" * 80)
@@ -62,7 +64,11 @@ def main():
         print("Please ensure structured_sops.txt is in the data directory")
         return 1
     
-    if os.path.exists(index_path):
+    # Reuse the existing index when it is newer than the SOP file; loading
+    # never touches the embedding model, so this skips the model load
+    # entirely for query-only and --build-index-only runs with a warm cache
+    if os.path.exists(index_path) and \
+            os.path.getmtime(index_path) >= os.path.getmtime(sop_file_path):
         print("Loading existing index...")
         identifier.load_index(index_path)
     else:
@@ -213,33 +219,38 @@ def print_result(result: dict, show_alternatives: bool = False):
         result: Result dictionary from select_best_sop
         show_alternatives: Whether to show alternative SOPs
     """
-    print()
-    print("SELECTED SOP:")
-    print("-" * 80)
-    
+    # Assemble the whole block and emit it with a single write instead of
+    # one locked/flushed print call per line
+    lines = ['', 'SELECTED SOP:', '-' * 80]
+
     if result['selected_sop_id']:
-        print(f"  ID:          {result['selected_sop_id']}")
-        print(f"  Number:      SOP-{result['selected_sop_number']:03d}")
-        print(f"  Title:       {result['selected_sop_title']}")
-        print(f"  Confidence:  {result['confidence_score']:.4f} ({result['confidence_level']})")
-        print(f"  Semantic:    {result['semantic_score']:.4f}")
-        print(f"  BM25:        {result['bm25_score']:.4f}")
-        print()
-        print(f"  Recommendation: {result['recommendation']}")
-        print(f"  Reason: {result['reason']}")
+        lines += [
+            f"  ID:          {result['selected_sop_id']}",
+            f"  Number:      SOP-{result['selected_sop_number']:03d}",
+            f"  Title:       {result['selected_sop_title']}",
+            f"  Confidence:  {result['confidence_score']:.4f} ({result['confidence_level']})",
+            f"  Semantic:    {result['semantic_score']:.4f}",
+            f"  BM25:        {result['bm25_score']:.4f}",
+            '',
+            f"  Recommendation: {result['recommendation']}",
+            f"  Reason: {result['reason']}",
+        ]
     else:
-        print(f"  No SOP found")
-        print(f"  Reason: {result['reason']}")
-    
+        lines += [
+            "  No SOP found",
+            f"  Reason: {result['reason']}",
+        ]
+
     if show_alternatives and result.get('alternative_sops'):
-        print()
-        print("ALTERNATIVE SOPs:")
-        print("-" * 80)
+        lines += ['', 'ALTERNATIVE SOPs:', '-' * 80]
         for i, sop in enumerate(result['alternative_sops'], 1):
-            print(f"  {i}. {sop['title']}")
-            print(f"     Confidence: {sop['confidence_score']:.4f} ({sop['confidence_level']})")
-    
-    print()
+            lines += [
+                f"  {i}. {sop['title']}",
+                f"     Confidence: {sop['confidence_score']:.4f} ({sop['confidence_level']})",
+            ]
+
+    lines.append('')
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 if __name__ == '__main__':
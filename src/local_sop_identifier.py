@@ -3,18 +3,186 @@ Local SOP Identifier using Sentence Transformers, FAISS, and BM25
 No external API calls - fully offline and lightweight
 """
 
+import bisect
+import functools
+import hashlib
 import json
+import mmap
 import os
 import re
 import pickle
+import threading
 import numpy as np
-from typing import List, Dict, Any, Tuple
-from sentence_transformers import SentenceTransformer
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from rank_bm25 import BM25Okapi
 import faiss
 import warnings
 warnings.filterwarnings('ignore')
 
+# Optional SIMD kernels for the similarity hot path: avoids BLAS dispatch
+# overhead on small corpora. numpy remains the fallback when absent.
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
+# Maximum number of query embeddings kept in the per-instance cache
+QUERY_CACHE_SIZE = 1024
+
+# Maximum number of ranked result lists kept per instance
+RESULT_CACHE_SIZE = 256
+
+# Corpus size at which the flat path stops computing the full dense
+# matvec in NumPy and delegates to the FAISS IndexFlatIP search (SIMD
+# kernels plus a native top-k heap); below this the matvec is faster
+# than the FAISS call overhead and keeps every score exact for fusion
+FAISS_SEARCH_MIN_SOPS = 4096
+
+# Long SOP bodies are split into overlapping character windows before
+# encoding: MiniLM truncates at 256 word pieces, so a single vector for a
+# multi-page SOP would describe only its first paragraphs. Windows are
+# scored individually and max-pooled back to one score per SOP
+EMBED_WINDOW_CHARS = 1500
+EMBED_WINDOW_STRIDE = 1200
+
+# Queries beyond these bounds are clamped before scoring: the encoder
+# truncates at its max_seq_length anyway (256 word pieces for MiniLM), so
+# tokenizing kilobytes past that is pure waste, and capping the BM25 token
+# list keeps pathological repeated-term queries cheap
+MAX_QUERY_CHARS = 4096
+MAX_QUERY_TOKENS = 512
+
+# Compiled once at import - _tokenize runs on every query and corpus document
+_TOKEN_RE = re.compile(r'\w+')
+
+# ASCII fast path for tokenization: map every non-word byte to a space so a
+# single C-level translate + split replaces the regex scan. Matches \w+ on
+# lowercased ASCII text exactly; non-ASCII input falls back to the regex.
+_TOKEN_TRANS = str.maketrans({
+    chr(c): ' ' for c in range(128)
+    if not (chr(c).isalnum() or chr(c) == '_')
+})
+
+@functools.lru_cache(maxsize=512)
+def _tokenize_cached(text: str) -> List[str]:
+    """
+    Tokenize text, caching results so re-processed queries (interactive
+    mode, repeated select_best_sop calls) skip the scan entirely
+
+    Args:
+        text: Input text
+
+    Returns:
+        List of tokens (callers must not mutate)
+    """
+    text = text.lower()
+    if text.isascii():
+        return text.translate(_TOKEN_TRANS).split()
+    return _TOKEN_RE.findall(text)
+
+
+@functools.lru_cache(maxsize=2)
+def _load_encoder(model_name: str, cache_dir: str):
+    """
+    Load a sentence transformer model, sharing one instance per
+    (model, cache dir) across all LocalSOPIdentifier instances in the
+    process - the model weights dominate both load time and memory
+
+    Args:
+        model_name: Sentence transformer model name
+        cache_dir: Directory to cache the model
+
+    Returns:
+        The loaded SentenceTransformer model
+    """
+    # Heavy import (torch etc.) deferred until the model is needed
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    # SentenceTransformer picks CUDA automatically when available;
+    # on CPU let torch use every core for the encode batches
+    if not torch.cuda.is_available():
+        torch.set_num_threads(os.cpu_count() or 1)
+
+    encoder = SentenceTransformer(model_name, cache_folder=cache_dir)
+    print("Model loaded successfully")
+    return encoder
+
+
+# Confidence bands for the hybrid score (0.6 * cosine + 0.4 * bm25_norm):
+# below 0.35 is LOW, 0.35-0.6 is MEDIUM, 0.6 and above is HIGH
+_CONFIDENCE_THRESHOLDS = (0.35, 0.6)
+_CONFIDENCE_LEVELS = ('LOW', 'MEDIUM', 'HIGH')
+
+
+def _confidence_level(score: float) -> str:
+    """
+    Map a hybrid confidence score to its qualitative level
+
+    Args:
+        score: Hybrid confidence score
+
+    Returns:
+        'LOW', 'MEDIUM' or 'HIGH'
+    """
+    return _CONFIDENCE_LEVELS[bisect.bisect_right(_CONFIDENCE_THRESHOLDS, score)]
+
+
+# Parsed-file cache keyed on (abspath, mtime_ns, size): repeated parses of
+# an unchanged SOP file (CLI restarts, test fixtures) skip the regex pass
+_PARSE_CACHE = {}
+_PARSE_CACHE_SIZE = 64
+
+
+# One SOP section: "SOP-N: Title" header line plus body, running up to the
+# next --- separator line (or end of file)
+_SOP_RE = re.compile(
+    r'^SOP-(\d+):[^\S\n]*([^\n]*)(?:.*?)(?=^\s*---|\Z)',
+    re.M | re.S
+)
+
+# Pieces of _SOP_RE used by the section-at-a-time parse paths: the ---
+# separator (str and bytes forms, the latter scanning an mmap directly)
+# and the header of a single section
+_SECTION_SPLIT_RE = re.compile(r'^\s*---', re.M)
+_SECTION_SPLIT_B_RE = re.compile(rb'^\s*---', re.M)
+_SOP_HEADER_RE = re.compile(r'^SOP-(\d+):[^\S\n]*([^\n]*)', re.M)
+
+# Corpus size at which parsing fans out across a process pool. Below
+# this the single-pass regex finishes in well under the pool startup
+# cost; parsing is regex work under the GIL, so threads would not help
+_PARALLEL_PARSE_MIN_BYTES = 4 * 1024 * 1024
+
+
+def _parse_section(section) -> Optional[Dict[str, Any]]:
+    """
+    Parse a single ----delimited section into an SOP chunk
+
+    Module-level so ProcessPoolExecutor workers can pickle it. Accepts
+    bytes (an mmap slice, decoded here so the whole file is never held
+    as one Python string) or str.
+
+    Args:
+        section: Raw text between two --- separators
+
+    Returns:
+        SOP chunk dict, or None when the section has no SOP header
+    """
+    if isinstance(section, bytes):
+        section = section.decode('utf-8')
+    match = _SOP_HEADER_RE.search(section)
+    if match is None:
+        return None
+    sop_number = int(match.group(1))
+    return {
+        'id': f'sop_{sop_number}',
+        'title': f"SOP-{sop_number}: {match.group(2).strip()}",
+        'content': section[match.start():].strip(),
+        'sop_number': sop_number
+    }
+
 
 class LocalSOPIdentifier:
     """
@@ -25,76 +193,235 @@ class LocalSOPIdentifier:
     - Hybrid scoring for robust results
     """
     
-    def __init__(self, model_name: str = 'all-MiniLM-L6-v2', cache_dir: str = './models'):
+    def __init__(
+        self,
+        model_name: str = 'all-MiniLM-L6-v2',
+        cache_dir: str = './models',
+        query_cache_dir: str = None
+    ):
         """
         Initialize the local SOP identifier
-        
+
         Args:
             model_name: Sentence transformer model name
             cache_dir: Directory to cache the model
+            query_cache_dir: Optional directory for a persistent
+                query-embedding cache shared across processes; None (the
+                default) keeps the cache in memory only
         """
         print(f"Initializing Local SOP Identifier with {model_name} and FAISS...")
-        
+
         # Create cache directory if it doesn't exist
         os.makedirs(cache_dir, exist_ok=True)
-        
-        
-        # Load sentence transformer model (small, fast, offline-capable)
-        
-        self.encoder = SentenceTransformer(model_name, cache_folder=cache_dir)
+
+        # The sentence transformer is loaded lazily on first use - parsing
+        # SOPs or loading a prebuilt index doesn't need the model at all
+        self.encoder = None
+        self.cache_dir = cache_dir
         self.model_name = model_name
         self.vector_dimension = 384  # all-MiniLM-L6-v2 embedding dimension
         
-        # Storage for SOPs
-        self.sop_chunks = []
+        # Storage for SOPs as parallel columns (structure-of-arrays: better
+        # cache locality in the ranking loop and a smaller metadata payload)
+        self.sop_ids = []
+        self.sop_titles = []
+        self.sop_contents = []
+        self.sop_numbers = np.array([], dtype=np.int32)
         self.sop_embeddings = None
+        # Row index where each SOP's embedding windows start, for indexes
+        # where long SOPs were split before encoding; None means the
+        # embedding matrix has exactly one row per SOP
+        self._chunk_offsets = None
+        # Per-vector dequantization scales when the index was built with
+        # quantize=True; None for float16/float32 embeddings
+        self._embedding_scales = None
         self.faiss_index = None
+        self.index_type = 'flat'
         self.bm25 = None
         self.tokenized_corpus = []
-        
-        print("Model loaded successfully")
-    
+
+        # Query embedding cache (query text -> normalized embedding)
+        self._query_embedding_cache = {}
+
+        # Optional on-disk tier for the query cache: one .npy per query,
+        # keyed by a hash of (model name, query) so a model switch never
+        # serves stale vectors
+        self.query_cache_dir = query_cache_dir
+        if query_cache_dir:
+            os.makedirs(query_cache_dir, exist_ok=True)
+
+        # Per-term BM25 posting lists (built from the fitted BM25 model)
+        self._bm25_postings = None
+
+        # Ranked-result cache ((query, top_k, weights) -> result list),
+        # cleared whenever the index changes
+        self._result_cache = {}
+
+        # Guards evict-then-insert on the two bounded caches: batch
+        # retrieval can score queries across threads (max_workers), and
+        # two workers racing the same eviction would KeyError
+        self._cache_lock = threading.Lock()
+
+    def _ensure_encoder(self):
+        """
+        Bind the shared sentence transformer model on first use
+
+        Importing and constructing the model takes seconds and hundreds of
+        MB, so it only happens when something actually needs to encode
+        text, and the loaded model is shared process-wide via _load_encoder.
+
+        Returns:
+            The loaded SentenceTransformer model
+        """
+        if self.encoder is None:
+            self.encoder = _load_encoder(self.model_name, self.cache_dir)
+        return self.encoder
+
+    def warmup(self):
+        """
+        Load the model and run one dummy encode
+
+        The first real encode pays lazy tokenizer/graph initialization on
+        top of the model load; calling this at process start moves that
+        one-off cost out of latency-sensitive paths.
+        """
+        self._ensure_encoder().encode(["x"], convert_to_numpy=True)
+
     def parse_sops(self, file_path: str) -> List[Dict[str, Any]]:
         """
         Parse SOPs from structured text file into chunks
-        
+
         Args:
             file_path: Path to the structured SOPs text file
-            
+
         Returns:
             List of SOP chunks with metadata
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Split by the --- separator
-        sop_sections = content.split('---')
-        
+        stat = os.stat(file_path)
+        cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None:
+            print(f"Parsed {len(cached)} SOP chunks (cached)")
+            # Shallow-copy each chunk so callers can't mutate the cache
+            return [dict(chunk) for chunk in cached]
+
+        chunks = self._parse_sops_file(file_path, stat.st_size)
+
+        if len(_PARSE_CACHE) >= _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+        _PARSE_CACHE[cache_key] = [dict(chunk) for chunk in chunks]
+        return chunks
+
+    def _parse_sops_file(self, file_path: str, file_size: int) -> List[Dict[str, Any]]:
+        """
+        Parse an SOP file by scanning an mmap of it section by section
+
+        The separator regex runs over the mapped bytes and each section
+        slice is decoded on its own, so the file is never duplicated as
+        one big Python string. Large files fan the per-section work out
+        across a process pool (workers receive raw byte slices).
+
+        Args:
+            file_path: Path to the structured SOPs text file
+            file_size: Size of the file in bytes (from the caller's stat)
+
+        Returns:
+            List of SOP chunks with metadata
+        """
+        if file_size == 0:
+            print("Parsed 0 SOP chunks")
+            return []
+
+        with open(file_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            sections = []
+            start = 0
+            for match in _SECTION_SPLIT_B_RE.finditer(buf):
+                sections.append(buf[start:match.start()])
+                start = match.end()
+            sections.append(buf[start:])
+
+            if file_size >= _PARALLEL_PARSE_MIN_BYTES:
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                    parsed = pool.map(_parse_section, sections, chunksize=64)
+                    chunks = [chunk for chunk in parsed if chunk is not None]
+            else:
+                chunks = [
+                    chunk for section in sections
+                    if (chunk := _parse_section(section)) is not None
+                ]
+
+        print(f"Parsed {len(chunks)} SOP chunks")
+        return chunks
+
+    def parse_sops_text(self, content: str) -> List[Dict[str, Any]]:
+        """
+        Parse SOPs from structured text into chunks
+
+        Args:
+            content: Structured SOP text (same format as the SOP file)
+
+        Returns:
+            List of SOP chunks with metadata
+        """
+        # Very large corpora: pre-split on --- in the main process and
+        # fan the per-section regex work out across a process pool
+        # (regex parsing holds the GIL, so threads would not overlap).
+        # map preserves input order, so chunk order matches the serial path
+        if len(content) >= _PARALLEL_PARSE_MIN_BYTES:
+            sections = _SECTION_SPLIT_RE.split(content)
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                parsed = pool.map(_parse_section, sections, chunksize=64)
+                chunks = [chunk for chunk in parsed if chunk is not None]
+            print(f"Parsed {len(chunks)} SOP chunks")
+            return chunks
+
+        # Stream matches from the compiled section regex instead of
+        # materializing an intermediate list of split sections
         chunks = []
-        
-        for section in sop_sections:
-            section = section.strip()
-            if section and section.startswith('SOP-'):
-                # Extract SOP number and title from first line
-                lines = section.split('\n')
-                first_line = lines[0].strip()
-                
-                # Parse "SOP-X: Title" format
-                if ':' in first_line:
-                    sop_part, title = first_line.split(':', 1)
-                    sop_number = int(sop_part.replace('SOP-', ''))
-                    title = title.strip()
-                    
-                    chunks.append({
-                        'id': f'sop_{sop_number}',
-                        'title': f"SOP-{sop_number}: {title}",
-                        'content': section,
-                        'sop_number': sop_number
-                    })
-        
+
+        for match in _SOP_RE.finditer(content):
+            sop_number = int(match.group(1))
+            title = match.group(2).strip()
+
+            chunks.append({
+                'id': f'sop_{sop_number}',
+                'title': f"SOP-{sop_number}: {title}",
+                'content': match.group(0).strip(),
+                'sop_number': sop_number
+            })
+
         print(f"Parsed {len(chunks)} SOP chunks")
         return chunks
-    
+
+    @property
+    def sop_chunks(self) -> List[Dict[str, Any]]:
+        """
+        SOP records as a list of dicts, built on demand from the
+        internal parallel columns
+        """
+        return [
+            {'id': sop_id, 'title': title, 'content': content, 'sop_number': int(number)}
+            for sop_id, title, content, number in zip(
+                self.sop_ids, self.sop_titles, self.sop_contents, self.sop_numbers
+            )
+        ]
+
+    def _set_sops(self, chunks: List[Dict[str, Any]]):
+        """
+        Store parsed SOP records as parallel columns
+
+        Args:
+            chunks: Parsed SOP chunks from parse_sops
+        """
+        self.sop_ids = [chunk['id'] for chunk in chunks]
+        self.sop_titles = [chunk['title'] for chunk in chunks]
+        self.sop_contents = [chunk['content'] for chunk in chunks]
+        self.sop_numbers = np.asarray(
+            [chunk['sop_number'] for chunk in chunks], dtype=np.int32
+        )
+
     def _tokenize(self, text: str) -> List[str]:
         """
         Simple tokenization for BM25
@@ -106,73 +433,492 @@ class LocalSOPIdentifier:
             List of tokens
         """
         # Convert to lowercase and split on non-alphanumeric characters
-        tokens = re.findall(r'\w+', text.lower())
-        return tokens
-    
-    def build_index(self, sop_file_path: str, save_path: str = './data/sop_index.pkl'):
+        return _tokenize_cached(text)
+
+    def _bm25_state(self) -> Dict[str, Any]:
+        """
+        Extract the fitted BM25 state for serialization
+
+        Returns:
+            Dictionary with the precomputed BM25 statistics
+        """
+        return {
+            'idf': self.bm25.idf,
+            'doc_freqs': self.bm25.doc_freqs,
+            'doc_len': self.bm25.doc_len,
+            'avgdl': self.bm25.avgdl,
+            'corpus_size': self.bm25.corpus_size,
+            'k1': self.bm25.k1,
+            'b': self.bm25.b,
+            'epsilon': self.bm25.epsilon
+        }
+
+    def _restore_bm25(self, state: Dict[str, Any]) -> BM25Okapi:
+        """
+        Rebuild a BM25Okapi instance from serialized state without
+        re-walking the corpus
+
+        Args:
+            state: Dictionary produced by _bm25_state()
+
+        Returns:
+            Fitted BM25Okapi instance
+        """
+        bm25 = BM25Okapi.__new__(BM25Okapi)
+        bm25.idf = state['idf']
+        bm25.doc_freqs = state['doc_freqs']
+        bm25.doc_len = state['doc_len']
+        bm25.avgdl = state['avgdl']
+        bm25.corpus_size = state['corpus_size']
+        bm25.k1 = state['k1']
+        bm25.b = state['b']
+        bm25.epsilon = state['epsilon']
+        bm25.tokenizer = None
+        return bm25
+
+    def _build_bm25_arrays(self):
+        """
+        Precompute per-term posting lists from the fitted BM25 model
+
+        The BM25 contribution of a term to a document depends only on the
+        corpus statistics, so the full score of every (term, document) pair
+        is computed once here. Scoring a query is then a handful of
+        gather-add passes over short postings arrays - no per-document
+        Python loop and no term-frequency matrix slicing at query time.
+        """
+        k1, b = self.bm25.k1, self.bm25.b
+        doc_len = np.asarray(self.bm25.doc_len, dtype=np.float64)
+        len_norm = k1 * (1 - b + b * doc_len / self.bm25.avgdl)
+
+        # token -> ([doc_idx, ...], [tf, ...]) accumulated across the corpus
+        raw = {}
+        for doc_idx, freqs in enumerate(self.bm25.doc_freqs):
+            for token, tf in freqs.items():
+                entry = raw.setdefault(token, ([], []))
+                entry[0].append(doc_idx)
+                entry[1].append(tf)
+
+        postings = {}
+        for token, (doc_ids, tfs) in raw.items():
+            doc_idx = np.asarray(doc_ids, dtype=np.int32)
+            tf = np.asarray(tfs, dtype=np.float64)
+            idf = self.bm25.idf.get(token) or 0
+            contrib = idf * tf * (k1 + 1) / (tf + len_norm[doc_idx])
+            postings[token] = (doc_idx, contrib.astype(np.float32))
+
+        self._bm25_postings = postings
+
+    def _bm25_scores(self, tokenized_query: List[str]) -> np.ndarray:
+        """
+        BM25 scoring via precomputed posting lists
+
+        Args:
+            tokenized_query: Query tokens
+
+        Returns:
+            BM25 score per document
+        """
+        scores = np.zeros(len(self.sop_ids), dtype=np.float64)
+
+        # Collapse repeated query terms to one pass each: BM25 scores a
+        # duplicated term additively, so weighting by count is equivalent
+        # and long repetitive queries touch each posting list once
+        for token, count in Counter(tokenized_query).items():
+            posting = self._bm25_postings.get(token)
+            if posting is not None:
+                # doc ids are unique within a posting list, so fancy-index
+                # accumulation is safe here
+                if count == 1:
+                    scores[posting[0]] += posting[1]
+                else:
+                    scores[posting[0]] += posting[1] * count
+        return scores
+
+    def _cache_query_embedding(self, query: str, embedding: np.ndarray):
+        """
+        Store a normalized query embedding in the bounded cache
+
+        Args:
+            query: Query text (cache key)
+            embedding: Normalized (1, dim) float32 embedding
+        """
+        with self._cache_lock:
+            if len(self._query_embedding_cache) >= QUERY_CACHE_SIZE:
+                # Evict the oldest entry (dicts preserve insertion order)
+                oldest = next(iter(self._query_embedding_cache))
+                self._query_embedding_cache.pop(oldest, None)
+            self._query_embedding_cache[query] = embedding
+
+    def _encode_query(self, query: str) -> np.ndarray:
+        """
+        Encode a query into a normalized embedding, with caching so
+        repeated queries (e.g. in interactive mode) skip the model forward pass
+
+        Args:
+            query: Query text
+
+        Returns:
+            Normalized (1, dim) float32 embedding
+        """
+        cached = self._query_embedding_cache.get(query)
+        if cached is not None:
+            return cached
+
+        disk_path = self._query_cache_path(query)
+        if disk_path and os.path.exists(disk_path):
+            query_embedding = np.load(disk_path).reshape(1, -1)
+            self._cache_query_embedding(query, query_embedding)
+            return query_embedding
+
+        query_embedding = self._ensure_encoder().encode(
+            query, convert_to_numpy=True, normalize_embeddings=True
+        )
+        query_embedding = query_embedding.reshape(1, -1).astype('float32')
+
+        self._cache_query_embedding(query, query_embedding)
+        if disk_path:
+            np.save(disk_path, query_embedding)
+        return query_embedding
+
+    def _query_cache_path(self, query: str) -> str:
+        """
+        Disk cache file for a query embedding, or None when the
+        persistent cache is disabled
+
+        Args:
+            query: Query text
+
+        Returns:
+            Path to the cache file, or None
+        """
+        if not self.query_cache_dir:
+            return None
+        digest = hashlib.blake2b(
+            f'{self.model_name}\x00{query}'.encode('utf-8'), digest_size=16
+        ).hexdigest()
+        return os.path.join(self.query_cache_dir, f'{digest}.npy')
+
+    def _semantic_scores(self, query_embedding: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of the query against every SOP
+
+        For the default flat index this is a single dense matrix-vector
+        product (both sides are L2-normalized). For an HNSW index - or a
+        flat index past FAISS_SEARCH_MIN_SOPS vectors, where the FAISS
+        SIMD kernels and native top-k heap beat the NumPy matvec - the
+        FAISS index is searched instead and the hits are scattered into a
+        dense score vector, leaving unvisited rows at zero. When long SOPs
+        were windowed at build time, the per-window scores are max-pooled
+        back to one score per SOP.
+
+        Args:
+            query_embedding: Normalized (1, dim) float32 query embedding
+
+        Returns:
+            Array of per-SOP similarity scores
+        """
+        n_vectors = len(self.sop_embeddings)
+        use_faiss = self.index_type == 'hnsw' or (
+            n_vectors >= FAISS_SEARCH_MIN_SOPS
+            and self.faiss_index is not None
+            and self._embedding_scales is None
+        )
+        if use_faiss:
+            k = min(n_vectors, 100)
+            distances, indices = self.faiss_index.search(query_embedding, k)
+            sims = np.zeros(n_vectors, dtype=np.float32)
+            hits = indices[0] != -1
+            sims[indices[0][hits]] = distances[0][hits]
+        elif self._embedding_scales is not None:
+            # Dequantize on the fly: int8 matvec result times per-vector scale
+            sims = self.sop_embeddings.astype(np.float32) @ query_embedding.ravel()
+            sims = sims * self._embedding_scales
+        elif simsimd is not None:
+            # Inline SIMD cosine: no BLAS thread-pool setup per query
+            query = np.ascontiguousarray(
+                query_embedding, dtype=self.sop_embeddings.dtype
+            )
+            distances = simsimd.cdist(query, self.sop_embeddings, metric='cosine')
+            sims = 1.0 - np.asarray(distances, dtype=np.float64)[0]
+        else:
+            sims = self.sop_embeddings @ query_embedding.ravel()
+
+        if self._chunk_offsets is not None:
+            # A SOP matches as well as its best-matching window
+            sims = np.maximum.reduceat(sims, self._chunk_offsets)
+        return sims
+
+    def build_index(
+        self,
+        sop_file_path: str,
+        save_path: str = './data/sop_index.pkl',
+        batch_size: int = 64,
+        index_type: str = 'flat',
+        quantize: bool = False,
+        use_cache: bool = False
+    ):
         """
         Build the search index with FAISS, semantic embeddings and BM25
-        
+
         Args:
             sop_file_path: Path to SOPs file
             save_path: Path to save the index
+            batch_size: Encoder batch size (tune up on GPU hosts)
+            index_type: 'flat' (exact, default) or 'hnsw' (approximate,
+                sub-linear search for corpora beyond a few thousand SOPs)
+            quantize: Store embeddings as int8 with per-vector scales
+                (4x smaller than float32; negligible ranking impact)
+            use_cache: Reuse a previously built index for identical SOP
+                content (keyed by content, model and build parameters
+                under ~/.cache/sop_finder) instead of re-encoding
         """
+        cache_path = None
+        if use_cache:
+            cache_path = self._index_cache_path(sop_file_path, index_type, quantize)
+            if os.path.exists(cache_path):
+                print("Index cache hit - loading prebuilt index")
+                self.load_index(cache_path)
+                # Callers may load_index(save_path) later, so a hit must
+                # still leave the index where they asked for it
+                if save_path:
+                    self._save_index(save_path)
+                return
+
         print("Building search index with FAISS...")
-        
-        # Parse SOPs
-        self.sop_chunks = self.parse_sops(sop_file_path)
-        
-        if not self.sop_chunks:
+
+        # parse_sops memoizes on file stat, so rebuilding from an
+        # unchanged file skips the parse entirely
+        chunks = self.parse_sops(sop_file_path)
+
+        self._build_index_from_chunks(
+            chunks,
+            save_path=save_path,
+            batch_size=batch_size,
+            index_type=index_type,
+            quantize=quantize
+        )
+
+        if cache_path:
+            self._save_index(cache_path)
+
+    def _index_cache_path(
+        self, sop_file_path: str, index_type: str, quantize: bool
+    ) -> str:
+        """
+        Cache location for an index built from the given SOP file
+
+        The key hashes the file content, the model name and the build
+        parameters, so editing the corpus, switching models or asking
+        for a different index layout always misses.
+
+        Args:
+            sop_file_path: Path to SOPs file
+            index_type: 'flat' or 'hnsw'
+            quantize: Whether embeddings are stored as int8
+
+        Returns:
+            Path to the cached index metadata file
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        with open(sop_file_path, 'rb') as f:
+            digest.update(f.read())
+        digest.update(self.model_name.encode('utf-8'))
+        digest.update(f'{index_type}:{int(quantize)}'.encode('utf-8'))
+
+        cache_dir = os.path.join(
+            os.path.expanduser('~'), '.cache', 'sop_finder', 'index'
+        )
+        os.makedirs(cache_dir, exist_ok=True)
+        return os.path.join(cache_dir, f'{digest.hexdigest()}.pkl')
+
+    def build_index_from_text(
+        self,
+        sop_text: str,
+        save_path: str = None,
+        batch_size: int = 64,
+        index_type: str = 'flat',
+        quantize: bool = False
+    ):
+        """
+        Build the search index directly from SOP text
+
+        Same as build_index but without touching the filesystem: useful
+        for programmatic corpora and tests. The index is only persisted
+        when save_path is given.
+
+        Args:
+            sop_text: Structured SOP text (same format as the SOP file)
+            save_path: Where to save the index, or None to keep it in memory
+            batch_size: Encoder batch size (tune up on GPU hosts)
+            index_type: 'flat' (exact, default) or 'hnsw' (approximate)
+            quantize: Store embeddings as int8 with per-vector scales
+        """
+        print("Building search index with FAISS...")
+
+        chunks = self.parse_sops_text(sop_text)
+
+        self._build_index_from_chunks(
+            chunks,
+            save_path=save_path,
+            batch_size=batch_size,
+            index_type=index_type,
+            quantize=quantize
+        )
+
+    def _build_index_from_chunks(
+        self,
+        chunks: List[Dict[str, Any]],
+        save_path: str = None,
+        batch_size: int = 64,
+        index_type: str = 'flat',
+        quantize: bool = False
+    ):
+        """
+        Build embeddings, FAISS and BM25 structures from parsed chunks,
+        optionally persisting the result
+
+        Args:
+            chunks: Parsed SOP chunks
+            save_path: Where to save the index, or None to keep it in memory
+            batch_size: Encoder batch size
+            index_type: 'flat' or 'hnsw'
+            quantize: Store embeddings as int8 with per-vector scales
+        """
+        if not chunks:
             raise ValueError("No SOP chunks found in the file")
-        
-        # Extract content for indexing
-        corpus = [chunk['content'] for chunk in self.sop_chunks]
-        
-        # Build semantic embeddings
+
+        # Any previously ranked results are stale once the corpus changes
+        self._result_cache.clear()
+
+        self._set_sops(chunks)
+
+        # Content column doubles as the indexing corpus
+        corpus = self.sop_contents
+
+        # Build semantic embeddings. Long SOPs are split into overlapping
+        # windows first - the encoder truncates at its max_seq_length, so
+        # one vector for a multi-page SOP would only ever describe its
+        # opening paragraphs. Each SOP's windows occupy a contiguous row
+        # range starting at _chunk_offsets[i]
+        texts = []
+        offsets = []
+        for doc in corpus:
+            offsets.append(len(texts))
+            if len(doc) > EMBED_WINDOW_CHARS:
+                texts.extend(
+                    doc[i:i + EMBED_WINDOW_CHARS]
+                    for i in range(0, len(doc), EMBED_WINDOW_STRIDE)
+                )
+            else:
+                texts.append(doc)
+        self._chunk_offsets = (
+            np.asarray(offsets, dtype=np.int32)
+            if len(texts) != len(corpus) else None
+        )
+
         print("Generating semantic embeddings...")
-        self.sop_embeddings = self.encoder.encode(
-            corpus, 
-            show_progress_bar=True,
-            convert_to_numpy=True
+        # normalize_embeddings=True folds L2 normalization into the model
+        # forward pass, so no second pass over the matrix is needed
+        self.sop_embeddings = self._ensure_encoder().encode(
+            texts,
+            batch_size=batch_size,
+            show_progress_bar=False,
+            convert_to_numpy=True,
+            normalize_embeddings=True
         )
-        
+        # FAISS and the scoring matvec both want C-contiguous float32
+        self.sop_embeddings = np.ascontiguousarray(
+            self.sop_embeddings, dtype=np.float32
+        )
+
         # Create FAISS index
         print("Building FAISS index...")
-        # Use IndexFlatIP for cosine similarity (after normalization)
-        self.faiss_index = faiss.IndexFlatIP(self.vector_dimension)
-        
-        # Normalize embeddings for cosine similarity
-        faiss.normalize_L2(self.sop_embeddings)
+        self.index_type = index_type
+        if index_type == 'hnsw':
+            # Approximate graph index: O(log N) search for large corpora
+            self.faiss_index = faiss.IndexHNSWFlat(
+                self.vector_dimension, 32, faiss.METRIC_INNER_PRODUCT
+            )
+            self.faiss_index.hnsw.efConstruction = 200
+            self.faiss_index.hnsw.efSearch = 64
+        else:
+            # Exact inner product (embeddings are normalized)
+            self.faiss_index = faiss.IndexFlatIP(self.vector_dimension)
         
-        # Add vectors to FAISS index
+        # Add vectors to FAISS index (requires float32)
         self.faiss_index.add(self.sop_embeddings)
+
+        if quantize:
+            # int8 with a per-vector scale: 4x smaller than float32 and
+            # near-lossless for cosine ranking at this dimensionality
+            scales = np.abs(self.sop_embeddings).max(axis=1)
+            scales[scales == 0] = 1.0
+            self._embedding_scales = (scales / 127.0).astype(np.float32)
+            self.sop_embeddings = np.round(
+                self.sop_embeddings / self._embedding_scales[:, None]
+            ).astype(np.int8)
+        else:
+            # Keep the embedding matrix in float16: halves memory and
+            # sidecar file size with no measurable effect on cosine ranking
+            # at this dimensionality (the matvec upcasts to float32)
+            self._embedding_scales = None
+            self.sop_embeddings = self.sop_embeddings.astype(np.float16)
         
         # Build BM25 index
         print("Building BM25 index...")
         self.tokenized_corpus = [self._tokenize(doc) for doc in corpus]
         self.bm25 = BM25Okapi(self.tokenized_corpus)
-        
-        # Save index
+        self._build_bm25_arrays()
+
+        if save_path:
+            self._save_index(save_path)
+
+        print(f"Index built successfully with {len(self.sop_ids)} SOPs")
+
+    def _save_index(self, save_path: str):
+        """
+        Persist the built index: JSON metadata plus FAISS and embedding
+        sidecar files
+
+        Args:
+            save_path: Path for the metadata file (.pkl)
+        """
         print(f"Saving index to {save_path}...")
         index_data = {
-            'sop_chunks': self.sop_chunks,
-            'sop_embeddings': self.sop_embeddings,
+            'sop_ids': self.sop_ids,
+            'sop_titles': self.sop_titles,
+            'sop_contents': self.sop_contents,
+            'sop_numbers': self.sop_numbers.tolist(),
             'tokenized_corpus': self.tokenized_corpus,
+            'bm25_state': self._bm25_state(),
+            'embedding_scales': (
+                self._embedding_scales.tolist()
+                if self._embedding_scales is not None else None
+            ),
+            'chunk_offsets': (
+                self._chunk_offsets.tolist()
+                if self._chunk_offsets is not None else None
+            ),
+            'index_type': self.index_type,
             'model_name': self.model_name,
             'vector_dimension': self.vector_dimension
         }
-        
+
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        
+
         # Save FAISS index separately
         faiss_index_path = save_path.replace('.pkl', '.faiss')
         faiss.write_index(self.faiss_index, faiss_index_path)
-        
-        # Save metadata
-        with open(save_path, 'wb') as f:
-            pickle.dump(index_data, f)
-        
-        print(f"Index built successfully with {len(self.sop_chunks)} SOPs")
+
+        # Save embeddings as a raw numpy sidecar (fast, zero-copy load)
+        embeddings_path = save_path.replace('.pkl', '.npy')
+        np.save(embeddings_path, self.sop_embeddings)
+
+        # Save metadata as JSON (plain list/dict/str data - faster and safer
+        # to load than pickle)
+        with open(save_path, 'w', encoding='utf-8') as f:
+            json.dump(index_data, f)
+
         print(f"FAISS index saved to {faiss_index_path}")
     
     def load_index(self, index_path: str = './data/sop_index.pkl'):
@@ -183,30 +929,83 @@ class LocalSOPIdentifier:
             index_path: Path to the saved index
         """
         print(f"Loading index from {index_path}...")
-        
+
+        self._result_cache.clear()
+
         if not os.path.exists(index_path):
             raise FileNotFoundError(f"Index file not found: {index_path}")
         
-        # Load metadata
+        # Load metadata; indexes built before the JSON format are still
+        # readable (pickle files start with the \x80 protocol opcode)
         with open(index_path, 'rb') as f:
-            index_data = pickle.load(f)
-        
-        self.sop_chunks = index_data['sop_chunks']
-        self.sop_embeddings = index_data.get('sop_embeddings', None)
+            is_legacy_pickle = f.read(1) == b'\x80'
+
+        if is_legacy_pickle:
+            with open(index_path, 'rb') as f:
+                index_data = pickle.load(f)
+            self.sop_embeddings = index_data.get('sop_embeddings', None)
+            if self.sop_embeddings is not None:
+                # Indexes from before normalize-at-build may hold raw
+                # vectors; renormalize so scoring stays a plain dot product
+                norms = np.linalg.norm(self.sop_embeddings, axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                self.sop_embeddings = self.sop_embeddings / norms
+        else:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                index_data = json.load(f)
+            embeddings_path = index_path.replace('.pkl', '.npy')
+            if os.path.exists(embeddings_path):
+                # Memory-map so repeated CLI runs share pages via the OS
+                # cache instead of re-reading the matrix each start
+                self.sop_embeddings = np.load(embeddings_path, mmap_mode='r')
+            else:
+                self.sop_embeddings = None
+
+        if 'sop_chunks' in index_data:
+            # Legacy format stored a list of per-SOP dicts
+            self._set_sops(index_data['sop_chunks'])
+        else:
+            self.sop_ids = index_data['sop_ids']
+            self.sop_titles = index_data['sop_titles']
+            self.sop_contents = index_data['sop_contents']
+            self.sop_numbers = np.asarray(index_data['sop_numbers'], dtype=np.int32)
         self.tokenized_corpus = index_data['tokenized_corpus']
         self.vector_dimension = index_data.get('vector_dimension', 384)
+        self.index_type = index_data.get('index_type', 'flat')
+        scales = index_data.get('embedding_scales')
+        self._embedding_scales = (
+            np.asarray(scales, dtype=np.float32) if scales is not None else None
+        )
+        # Legacy formats predate SOP windowing: one row per SOP
+        offsets = index_data.get('chunk_offsets')
+        self._chunk_offsets = (
+            np.asarray(offsets, dtype=np.int32) if offsets is not None else None
+        )
         
         # Load FAISS index
         faiss_index_path = index_path.replace('.pkl', '.faiss')
         if not os.path.exists(faiss_index_path):
             raise FileNotFoundError(f"FAISS index file not found: {faiss_index_path}")
         
-        self.faiss_index = faiss.read_index(faiss_index_path)
-        
-        # Rebuild BM25 from tokenized corpus
-        self.bm25 = BM25Okapi(self.tokenized_corpus)
+        # Memory-mapped read: the kernel page cache serves repeated process
+        # starts without copying the whole index into the heap
+        self.faiss_index = faiss.read_index(
+            faiss_index_path,
+            faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+        )
+        if self.index_type == 'hnsw':
+            self.faiss_index.hnsw.efSearch = 64
+
+        # Restore the fitted BM25 state; legacy indexes without it fall back
+        # to re-fitting from the tokenized corpus
+        bm25_state = index_data.get('bm25_state')
+        if bm25_state is not None:
+            self.bm25 = self._restore_bm25(bm25_state)
+        else:
+            self.bm25 = BM25Okapi(self.tokenized_corpus)
+        self._build_bm25_arrays()
         
-        print(f"Index loaded successfully with {len(self.sop_chunks)} SOPs")
+        print(f"Index loaded successfully with {len(self.sop_ids)} SOPs")
         print(f"FAISS index: {self.faiss_index.ntotal} vectors")
     
     def retrieve_relevant_sops(
@@ -228,77 +1027,155 @@ class LocalSOPIdentifier:
         Returns:
             List of relevant SOPs with scores
         """
-        if not self.sop_chunks or self.faiss_index is None:
+        if not self.sop_ids or self.sop_embeddings is None:
             raise ValueError("Index not built or loaded. Call build_index() or load_index() first.")
-        
+
+        # Nothing to match against: skip the model forward pass entirely
+        # (select_best_sop turns an empty result into a NO_MATCH verdict)
+        if not query or not query.strip():
+            return []
+
+        if len(query) > MAX_QUERY_CHARS:
+            query = query[:MAX_QUERY_CHARS]
+
+        cache_key = (query, top_k, semantic_weight, bm25_weight)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            # Hand out copies so callers can't mutate the cached records
+            return [dict(record) for record in cached]
+
         print(f"Searching for: {query[:100]}...")
+
+        # Generate and normalize query embedding (cached across calls)
+        query_embedding = self._encode_query(query)
+
+        # Semantic similarity over all SOPs
+        semantic_scores = self._semantic_scores(query_embedding)
         
-        # Generate and normalize query embedding
-        query_embedding = self.encoder.encode(query, convert_to_numpy=True)
-        query_embedding = query_embedding.reshape(1, -1).astype('float32')
-        faiss.normalize_L2(query_embedding)
-        
-        # Search FAISS index for semantic similarity
-        # Get all documents to compute full ranking
-        k = min(len(self.sop_chunks), 100)  # Search more than top_k for better hybrid ranking
-        distances, indices = self.faiss_index.search(query_embedding, k)
-        
-        # FAISS returns distances (inner product after normalization = cosine similarity)
-        # Create full semantic scores array
-        semantic_scores = np.zeros(len(self.sop_chunks))
-        for i, idx in enumerate(indices[0]):
-            if idx != -1:  # Valid index
-                semantic_scores[idx] = distances[0][i]
+        # Calculate BM25 scores (vectorized)
+        tokenized_query = self._tokenize(query)[:MAX_QUERY_TOKENS]
+        bm25_scores = self._bm25_scores(tokenized_query)
         
-        # Calculate BM25 scores
-        tokenized_query = self._tokenize(query)
-        bm25_scores = self.bm25.get_scores(tokenized_query)
+        # Normalize BM25 scores to [0, 1] and fold both weights into a single
+        # fused pass: one output allocation, no intermediate normalized array
+        # (semantic scores are already cosine similarity [0, 1])
+        bm25_max = bm25_scores.max() if len(bm25_scores) else 0.0
+        bm25_scale = (1.0 / bm25_max) if bm25_max > 0 else 0.0
+
+        hybrid_scores = np.multiply(semantic_scores, semantic_weight, dtype=np.float64)
+        np.add(hybrid_scores, bm25_scores * (bm25_weight * bm25_scale), out=hybrid_scores)
         
-        # Normalize BM25 scores to [0, 1] range (semantic scores are already cosine similarity [0, 1])
-        if bm25_scores.max() > 0:
-            bm25_scores_norm = bm25_scores / bm25_scores.max()
+        # Get top-k indices: O(N) partition plus a sort of only the k kept
+        # scores, instead of sorting the whole array
+        if top_k < len(hybrid_scores):
+            partition = np.argpartition(hybrid_scores, -top_k)[-top_k:]
+            top_indices = partition[np.argsort(hybrid_scores[partition])[::-1]]
         else:
-            bm25_scores_norm = bm25_scores
-        
-        # Hybrid scoring (use raw cosine similarity for semantic scores)
-        hybrid_scores = (
-            semantic_weight * semantic_scores + 
-            bm25_weight * bm25_scores_norm
-        )
-        
-        # Get top-k indices
-        top_indices = np.argsort(hybrid_scores)[::-1][:top_k]
+            top_indices = np.argsort(hybrid_scores)[::-1]
         
         # Prepare results with confidence scores
         results = []
         for idx in top_indices:
             confidence = float(hybrid_scores[idx])
-            
-            # Determine confidence level
-            # Since we use raw cosine similarity (0-1) for semantic scores
-            # the hybrid score is: 0.6 * cosine + 0.4 * bm25_norm
-            # Adjusted thresholds for absolute confidence
-            if confidence >= 0.6:  # Very strong match
-                confidence_level = "HIGH"
-            elif confidence >= 0.35:  # Moderate match
-                confidence_level = "MEDIUM"
-            else:
-                confidence_level = "LOW"
-            
+            confidence_level = _confidence_level(confidence)
+
             results.append({
-                'id': self.sop_chunks[idx]['id'],
-                'title': self.sop_chunks[idx]['title'],
-                'sop_number': self.sop_chunks[idx]['sop_number'],
+                'id': self.sop_ids[idx],
+                'title': self.sop_titles[idx],
+                'sop_number': int(self.sop_numbers[idx]),
                 'confidence_score': round(confidence, 4),
                 'confidence_level': confidence_level,
-                'semantic_score': round(float(semantic_scores[idx]), 4),
-                'bm25_score': round(float(bm25_scores_norm[idx]), 4),
-                'content_preview': self.sop_chunks[idx]['content'][:200] + "..."
+                # Clip: float16 storage can nudge a cosine a hair past 1.0
+                'semantic_score': round(float(np.clip(semantic_scores[idx], 0.0, 1.0)), 4),
+                'bm25_score': round(float(bm25_scores[idx] * bm25_scale), 4),
+                'content_preview': self.sop_contents[idx][:200] + "..."
             })
         
-        print(f"Found {len(results)} relevant SOPs using FAISS")
+        with self._cache_lock:
+            if len(self._result_cache) >= RESULT_CACHE_SIZE:
+                self._result_cache.pop(next(iter(self._result_cache)), None)
+            self._result_cache[cache_key] = [dict(record) for record in results]
+
+        print(f"Found {len(results)} relevant SOPs")
         return results
-    
+
+    def _precache_query_embeddings(self, queries: List[str], batch_size: int = 32):
+        """
+        Encode any not-yet-cached queries in one batched forward pass
+
+        Args:
+            queries: Query strings (duplicates and empties are skipped)
+            batch_size: Encoder batch size
+        """
+        pending = [
+            query for query in dict.fromkeys(queries)
+            if query and query.strip() and query not in self._query_embedding_cache
+        ]
+        if not pending:
+            return
+
+        embeddings = self._ensure_encoder().encode(
+            pending,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        ).astype('float32')
+        for query, embedding in zip(pending, np.atleast_2d(embeddings)):
+            self._cache_query_embedding(query, embedding.reshape(1, -1))
+
+    def retrieve_relevant_sops_batch(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        semantic_weight: float = 0.6,
+        bm25_weight: float = 0.4,
+        max_workers: int = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Retrieve relevant SOPs for several queries at once
+
+        The encoder sees all distinct queries as one batched forward pass;
+        scoring and ranking then run per query against the warm cache.
+
+        Args:
+            queries: Search queries
+            top_k: Number of top results per query
+            semantic_weight: Weight for semantic similarity (0-1)
+            bm25_weight: Weight for BM25 score (0-1)
+            max_workers: Score queries across this many threads. The
+                similarity kernels (FAISS search, BLAS matvec) release
+                the GIL, so threads overlap on large corpora; the
+                default of None keeps scoring serial, which wins for
+                small corpora where per-query work is microseconds
+
+        Returns:
+            One result list per query, in input order
+        """
+        if not self.sop_ids or self.sop_embeddings is None:
+            raise ValueError("Index not built or loaded. Call build_index() or load_index() first.")
+
+        clamped = [
+            query[:MAX_QUERY_CHARS] if query and len(query) > MAX_QUERY_CHARS else query
+            for query in queries
+        ]
+        self._precache_query_embeddings(clamped)
+
+        def _one(query):
+            return self.retrieve_relevant_sops(
+                query,
+                top_k=top_k,
+                semantic_weight=semantic_weight,
+                bm25_weight=bm25_weight
+            )
+
+        if max_workers and max_workers > 1 and len(clamped) > 1:
+            # Embeddings are pre-cached above, so workers never race the
+            # encoder; map preserves input order
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                return list(pool.map(_one, clamped))
+
+        return [_one(query) for query in clamped]
+
     def select_best_sop(
         self, 
         incident_context: str, 
@@ -361,38 +1238,72 @@ class LocalSOPIdentifier:
             'alternative_sops': relevant_sops[1:] if len(relevant_sops) > 1 else []
         }
     
-    def process_incident(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _build_incident_context(self, input_data: Dict[str, Any]) -> str:
         """
-        Process incident data and select best SOP
-        
+        Build the search context string from incident data
+
         Args:
             input_data: Incident data dictionary
-            
+
         Returns:
-            SOP selection result
+            Context string for retrieval
         """
-        # Extract incident context
         incident = input_data.get('incident_details', {})
         log_insights = input_data.get('log_insights', {})
-        
+
         context_parts = []
-        
+
         # Basic incident info
         if incident.get('short_description'):
             context_parts.append(f"Issue: {incident['short_description']}")
         if incident.get('description'):
             context_parts.append(f"Description: {incident['description']}")
-        
+
         # Log analysis
         if log_insights.get('full_analysis'):
             context_parts.append(f"Log Summary: {log_insights['full_analysis']}")
-        
+
         incident_context = " | ".join(context_parts)
-        
+
         if not incident_context:
             incident_context = str(input_data)
-        
+
+        return incident_context
+
+    def process_incident(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Process incident data and select best SOP
+
+        Args:
+            input_data: Incident data dictionary
+
+        Returns:
+            SOP selection result
+        """
+        incident_context = self._build_incident_context(input_data)
+
         # Select best SOP
         result = self.select_best_sop(incident_context)
-        
+
         return result
+
+    def process_incidents(self, input_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process multiple incidents, encoding all contexts in a single
+        batched model forward pass instead of one call per incident
+
+        Args:
+            input_list: List of incident data dictionaries
+
+        Returns:
+            List of SOP selection results (same order as input)
+        """
+        contexts = [self._build_incident_context(data) for data in input_list]
+
+        # Batch-encode all contexts not already cached (clamped the same
+        # way retrieve_relevant_sops clamps, so the cache keys line up)
+        self._precache_query_embeddings(
+            [c[:MAX_QUERY_CHARS] if len(c) > MAX_QUERY_CHARS else c for c in contexts]
+        )
+
+        return [self.select_best_sop(context) for context in contexts]
@@ -0,0 +1,50 @@
+"""
+Shared pytest fixtures
+"""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+# Pin BLAS/OpenMP pools to one thread before numpy/torch/faiss import and
+# size them: per-call pool spin-up otherwise dominates small-corpus query
+# timings and makes the performance asserts jittery
+os.environ.setdefault('OMP_NUM_THREADS', '1')
+os.environ.setdefault('MKL_NUM_THREADS', '1')
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _single_threaded_faiss():
+    """Keep FAISS single-threaded for reproducible query timings"""
+    import faiss
+    faiss.omp_set_num_threads(1)
+
+
+@pytest.fixture(scope='session')
+def shared_sop_dir(tmp_path_factory):
+    """Session-scoped directory holding deduplicated SOP fixture files"""
+    return tmp_path_factory.mktemp('sops')
+
+
+@pytest.fixture(scope='session')
+def sop_file_factory(shared_sop_dir):
+    """
+    Factory writing SOP text to a shared file, once per unique content
+
+    Files are keyed by content hash, so every test (and every run of the
+    same test) asking for the same corpus reuses one file instead of
+    paying mkdtemp/write/rmtree per test.
+    """
+    def _write(sop_content: str) -> Path:
+        digest = hashlib.md5(sop_content.encode('utf-8')).hexdigest()
+        path = shared_sop_dir / f'{digest}.txt'
+        if not path.exists():
+            path.write_bytes(sop_content.encode('utf-8'))
+        return path
+
+    return _write
@@ -4,8 +4,6 @@ Unit tests for LocalSOPIdentifier
 
 import pytest
 import os
-import tempfile
-import shutil
 from pathlib import Path
 import sys
 
@@ -17,14 +15,9 @@ from src.local_sop_identifier import LocalSOPIdentifier
 
 class TestSOPParsing:
     """Test SOP parsing functionality"""
-    
-    def setup_method(self):
-        """Create a temporary SOP file for testing"""
-        self.test_dir = tempfile.mkdtemp()
-        self.sop_file = os.path.join(self.test_dir, 'test_sops.txt')
-        
-        # Create a sample SOP file
-        sop_content = """SOP-001: Database Service Outage Response
+
+    # Sample SOP text (same format as the SOP file)
+    sop_content = """SOP-001: Database Service Outage Response
 
 ## Purpose
 This procedure provides step-by-step instructions for responding to complete database service outages.
@@ -62,18 +55,11 @@ OAuth, SAML, and SSO systems.
 - Login failures
 - 401/403 errors in logs
 """
-        
-        with open(self.sop_file, 'w', encoding='utf-8') as f:
-            f.write(sop_content)
-    
-    def teardown_method(self):
-        """Clean up temporary files"""
-        shutil.rmtree(self.test_dir)
-    
+
     def test_parse_sops(self):
         """Test that SOPs are parsed correctly"""
         identifier = LocalSOPIdentifier()
-        chunks = identifier.parse_sops(self.sop_file)
+        chunks = identifier.parse_sops_text(self.sop_content)
         
         assert len(chunks) == 3
         assert chunks[0]['sop_number'] == 1
@@ -87,7 +73,7 @@ OAuth, SAML, and SSO systems.
     def test_sop_content_structure(self):
         """Test that SOP chunks have required fields"""
         identifier = LocalSOPIdentifier()
-        chunks = identifier.parse_sops(self.sop_file)
+        chunks = identifier.parse_sops_text(self.sop_content)
         
         for chunk in chunks:
             assert 'id' in chunk
@@ -101,15 +87,9 @@ OAuth, SAML, and SSO systems.
 
 class TestIndexBuilding:
     """Test index building and loading"""
-    
-    def setup_method(self):
-        """Create test environment"""
-        self.test_dir = tempfile.mkdtemp()
-        self.sop_file = os.path.join(self.test_dir, 'test_sops.txt')
-        self.index_file = os.path.join(self.test_dir, 'test_index.pkl')
-        
-        # Create minimal SOP file
-        sop_content = """SOP-001: Database Outage
+
+    # Minimal SOP corpus
+    sop_content = """SOP-001: Database Outage
 
 Handle database outages and connection issues.
 ---
@@ -117,12 +97,12 @@ SOP-002: API Issues
 
 Resolve API performance problems.
 """
-        with open(self.sop_file, 'w', encoding='utf-8') as f:
-            f.write(sop_content)
-    
-    def teardown_method(self):
-        """Clean up"""
-        shutil.rmtree(self.test_dir)
+
+    @pytest.fixture(autouse=True)
+    def setup(self, sop_file_factory, tmp_path):
+        """Create test environment"""
+        self.sop_file = str(sop_file_factory(self.sop_content))
+        self.index_file = str(tmp_path / 'test_index.pkl')
     
     def test_build_index(self):
         """Test index building"""
@@ -167,10 +147,7 @@ class TestRetrieval:
     @pytest.fixture(autouse=True)
     def setup(self):
         """Setup for retrieval tests"""
-        self.test_dir = tempfile.mkdtemp()
-        self.sop_file = os.path.join(self.test_dir, 'test_sops.txt')
-        
-        # Create test SOPs
+        # Test SOPs, indexed in memory - no file round-trip needed here
         sop_content = """SOP-001: Database Service Outage Response
 
 ## Purpose
@@ -207,18 +184,10 @@ Fix authentication and login issues.
 
 Keywords: authentication, login, OAuth, SSO, 401, 403, unauthorized
 """
-        
-        with open(self.sop_file, 'w', encoding='utf-8') as f:
-            f.write(sop_content)
-        
-        # Build index
+
+        # Build index in memory
         self.identifier = LocalSOPIdentifier()
-        self.identifier.build_index(self.sop_file)
-        
-        yield
-        
-        # Cleanup
-        shutil.rmtree(self.test_dir)
+        self.identifier.build_index_from_text(sop_content)
     
     def test_retrieve_database_issue(self):
         """Test retrieval for database-related query"""
@@ -325,9 +294,6 @@ class TestSOPSelection:
     @pytest.fixture(autouse=True)
     def setup(self):
         """Setup for selection tests"""
-        self.test_dir = tempfile.mkdtemp()
-        self.sop_file = os.path.join(self.test_dir, 'test_sops.txt')
-        
         sop_content = """SOP-001: Database Service Outage
 
 Handle database outages, connection failures, timeouts.
@@ -336,16 +302,9 @@ SOP-002: API Performance Issues
 
 Resolve slow API response times.
 """
-        
-        with open(self.sop_file, 'w', encoding='utf-8') as f:
-            f.write(sop_content)
-        
+
         self.identifier = LocalSOPIdentifier()
-        self.identifier.build_index(self.sop_file)
-        
-        yield
-        
-        shutil.rmtree(self.test_dir)
+        self.identifier.build_index_from_text(sop_content)
     
     def test_select_best_sop_structure(self):
         """Test that select_best_sop returns correct structure"""
@@ -413,21 +372,13 @@ class TestEdgeCases:
     
     def test_empty_query(self):
         """Test behavior with empty query"""
-        test_dir = tempfile.mkdtemp()
-        sop_file = os.path.join(test_dir, 'test_sops.txt')
-        
-        with open(sop_file, 'w') as f:
-            f.write("SOP-001: Test\n\nTest content\n")
-        
         identifier = LocalSOPIdentifier()
-        identifier.build_index(sop_file)
-        
+        identifier.build_index_from_text("SOP-001: Test\n\nTest content\n")
+
         results = identifier.retrieve_relevant_sops(query="", top_k=1)
-        
+
         # Should still return results (even if scores are low)
         assert len(results) >= 0
-        
-        shutil.rmtree(test_dir)
     
     def test_query_without_index(self):
         """Test querying without building index first"""
@@ -438,44 +389,28 @@ class TestEdgeCases:
     
     def test_very_long_query(self):
         """Test with very long query"""
-        test_dir = tempfile.mkdtemp()
-        sop_file = os.path.join(test_dir, 'test_sops.txt')
-        
-        with open(sop_file, 'w') as f:
-            f.write("SOP-001: Test\n\nTest content\n")
-        
         identifier = LocalSOPIdentifier()
-        identifier.build_index(sop_file)
-        
+        identifier.build_index_from_text("SOP-001: Test\n\nTest content\n")
+
         # Create a very long query (1000+ words)
         long_query = "database " * 1000
-        
+
         results = identifier.retrieve_relevant_sops(query=long_query, top_k=1)
-        
+
         # Should handle it without crashing
         assert len(results) > 0
-        
-        shutil.rmtree(test_dir)
     
     def test_special_characters_in_query(self):
         """Test query with special characters"""
-        test_dir = tempfile.mkdtemp()
-        sop_file = os.path.join(test_dir, 'test_sops.txt')
-        
-        with open(sop_file, 'w') as f:
-            f.write("SOP-001: Test\n\nTest content @#$%\n")
-        
         identifier = LocalSOPIdentifier()
-        identifier.build_index(sop_file)
-        
+        identifier.build_index_from_text("SOP-001: Test\n\nTest content @#$%\n")
+
         results = identifier.retrieve_relevant_sops(
             query="Test @#$% special chars!?",
             top_k=1
         )
-        
+
         assert len(results) > 0
-        
-        shutil.rmtree(test_dir)
 
 
 if __name__ == '__main__':